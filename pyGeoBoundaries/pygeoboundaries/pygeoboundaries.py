@@ -1,149 +1,491 @@
 import os
+import re
+import sys
+import time
 import shutil
+import io
 import zipfile
-import requests
+import tempfile
 import datetime
-import pandas as pd
-import geopandas as gpd
+import logging
+import collections
+import functools
+import concurrent.futures
 from io import StringIO
-from shapely.validation import explain_validity
+
+# requests and the scientific stack (numpy, pandas, geopandas, shapely, pyproj)
+# are imported inside the functions that use them. Importing geopandas alone
+# takes seconds on a cold start, and text-only checks such as metaCheck never
+# need it.
+
+try:
+    from platformdirs import user_cache_dir
+except ImportError:
+    user_cache_dir = None
 
 admTypes = ["ADM0", "ADM1", "ADM2", "ADM3", "ADM4", "ADM5"]
 productTypes = ["gbOpen", "gbAuthoritative", "gbHumanitarian"]
 
+# Boundary and release types accepted in meta.txt; release types are lower-case
+_admTypeSet = frozenset(admTypes)
+_releaseTypes = frozenset(
+    [
+        "geoboundaries",
+        "gbauthoritative",
+        "gbhumanitarian",
+        "gbopen",
+        "un_salb",
+        "un_ocha",
+    ]
+)
+
+# Column names recognised as holding boundary names and ISO codes
+nameColumns = frozenset(
+    ["Name", "name", "NAME", "shapeName", "shapename", "SHAPENAME", "MAX_Name"]
+)
+isoColumns = frozenset(
+    [
+        "ISO",
+        "ISO_code",
+        "ISO_Code",
+        "iso",
+        "shapeISO",
+        "shapeiso",
+        "shape_iso",
+        "MAX_ISO_Co",
+    ]
+)
+
 # Define the URLs
 countries_url = (
     "https://github.com/wmgeolab/geoBoundaryBot/raw/main/dta/iso_3166_1_alpha_3.csv"
 )
 licenses_url = "https://github.com/wmgeolab/geoBoundaryBot/raw/main/dta/gbLicenses.csv"
 
-# Fetch CSV data from URLs
-countries_csv = requests.get(countries_url).text
-licenses_csv = requests.get(licenses_url).text
+# Translation table that deletes spaces and tabs, for blank-value checks
+_whitespace = str.maketrans("", "", " \t")
+
+# Metadata values that stand for a missing entry
+_nullValues = frozenset(["na", "nan", "null"])
 
-# Read CSV data into DataFrames
-countries = pd.read_csv(StringIO(countries_csv))
-licenses = pd.read_csv(StringIO(licenses_csv))
+# Recently loaded geometry files, most recently used last. Repeated checks on an
+# unchanged file reuse these instead of reading it again
+_loadCache = collections.OrderedDict()
+loadCacheSize = 4
 
-# Extract values from DataFrames
-isoList1 = countries["Alpha-3code"].tolist()
-licenseList1 = licenses["license_name"].tolist()
+# Downloaded reference CSVs are reused from disk for this many seconds
+cacheMaxAge = 7 * 24 * 60 * 60
 
+# Check results go through this logger whenever the application has configured
+# logging (basicConfig, its own handlers, pytest's caplog). Otherwise they are
+# printed to stdout as "LEVEL message"; setting this logger's level filters both
+log = logging.getLogger("pygeoboundaries")
 
-def loadFile(path, temp_path=None):
+# Levels behind the labels used in the check reports
+_logLevels = {"INFO": logging.INFO, "WARN": logging.WARNING, "CRITICAL": logging.CRITICAL}
+
+
+def _cacheDir():
     """
-    Load File: Read GeoJSON or Shapefile, or extract and read from a zip file.
+    Directory where the downloaded reference CSVs are cached.
+    """
+    if user_cache_dir is not None:
+        return user_cache_dir("pygeoboundaries")
+    return os.path.join(os.path.expanduser("~"), ".cache", "pygeoboundaries")
 
-    Parameters:
-    -----------
-    path : str : The file path to the GeoJSON, Shapefile, or a zip file containing them.
-    temp_path : str : Optional. The temporary path to extract files from a zip. 
-                    If not provided, it defaults to the directory where the script is located.
 
-    Returns:
-    --------
-    GeoDataFrame
-        A GeoDataFrame containing the loaded geometry data.
+@functools.lru_cache(maxsize=None)
+def _getSession():
+    """
+    Shared HTTP session so reference downloads reuse pooled keep-alive connections.
+    """
+    import requests
 
-    Usage:
-    ------
-    >>> from pygeoboundaries import loadFile
-    >>> geom_data = loadFile(path='/path/to/your/file.geojson', temp_path='/path/to/temp/folder')
+    return requests.Session()
+
+
+def _fetchCsv(url, filename):
     """
-    if temp_path is None:
-        temp_path = os.path.dirname(os.path.abspath(__file__))
+    Return the text of a reference CSV. A cached copy younger than cacheMaxAge is
+    used as is; otherwise the CSV is downloaded and written back to the cache.
+    A stale copy is still used if the download fails.
+    """
+    import requests
+
+    cache_path = os.path.join(_cacheDir(), filename)
+    fresh = (
+        os.path.exists(cache_path)
+        and time.time() - os.path.getmtime(cache_path) < cacheMaxAge
+    )
+    if not fresh:
+        try:
+            response = _getSession().get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException:
+            if not os.path.exists(cache_path):
+                raise
+        else:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                # Write to a uniquely named file first, so concurrent writers in
+                # other threads or processes never share it and readers never
+                # see a partial CSV
+                fd, partial_path = tempfile.mkstemp(
+                    dir=os.path.dirname(cache_path), prefix=filename + ".", suffix=".partial"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as file:
+                        file.write(response.text)
+                    os.replace(partial_path, cache_path)
+                except OSError:
+                    os.remove(partial_path)
+                    raise
+            except OSError:
+                pass
+            return response.text
+
+    with open(cache_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _getReferenceLists():
+    """
+    Valid ISO 3166-1 alpha-3 codes and geoBoundaries license names, fetched on
+    first use. Both CSVs are requested concurrently so a cold cache costs one
+    round trip rather than two.
+    """
+    import pandas as pd
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        countries_future = executor.submit(
+            _fetchCsv, countries_url, "iso_3166_1_alpha_3.csv"
+        )
+        licenses_future = executor.submit(_fetchCsv, licenses_url, "gbLicenses.csv")
+        countries_csv = countries_future.result()
+        licenses_csv = licenses_future.result()
+
+    # Only the one column used from each CSV is parsed
+    countries = pd.read_csv(StringIO(countries_csv), usecols=["Alpha-3code"])
+    licenses = pd.read_csv(StringIO(licenses_csv), usecols=["license_name"])
+    return (
+        frozenset(countries["Alpha-3code"].tolist()),
+        # License names are matched case-insensitively, so normalise them once here
+        frozenset(
+            name.lower().strip() for name in licenses["license_name"].dropna().tolist()
+        ),
+    )
+
+
+def _getIsoList():
+    """
+    Valid ISO 3166-1 alpha-3 codes.
+    """
+    return _getReferenceLists()[0]
+
+
+def _getLicenseList():
+    """
+    License names accepted by geoBoundaries, lower-cased and stripped.
+    """
+    return _getReferenceLists()[1]
+
+
+def _emit(messages):
+    """
+    Report a batch of (level, message) pairs. They are logged through the
+    pygeoboundaries logger if any handler would receive them; otherwise the ones
+    at or above the logger's level (INFO if unset) are written to stdout with a
+    single write call, in the same "LEVEL message" form as print("LEVEL", message).
+    """
+    if log.hasHandlers():
+        for level, message in messages:
+            log.log(_logLevels[level], message)
+        return
+    threshold = log.level or logging.INFO
+    text = "".join(
+        f"{level} {message}\n" for level, message in messages if _logLevels[level] >= threshold
+    )
+    if text:
+        sys.stdout.write(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _canUseArrow():
+    """
+    Whether pyogrio can hand features over as an Arrow table, which needs
+    pyarrow and GDAL >= 3.6.
+    """
+    try:
+        import pyarrow
+        import pyogrio
+    except ImportError:
+        return False
+    return pyogrio.__gdal_version__ >= (3, 6, 0)
+
+
+def _readFile(path, columns=None, ignore_geometry=False, max_features=None):
+    """
+    Read a vector file with the pyogrio engine, falling back to the geopandas
+    default engine when pyogrio is not installed. pyogrio only reads the
+    requested columns and skips any that are missing from the file, and moves
+    the data over in bulk as Arrow columns when it can. max_features stops
+    either engine after that many features.
+    """
+    import geopandas as gpd
+
+    try:
+        return gpd.read_file(
+            path,
+            engine="pyogrio",
+            use_arrow=_canUseArrow(),
+            columns=columns,
+            ignore_geometry=ignore_geometry,
+            max_features=max_features,
+        )
+    except ImportError:
+        # Other engines do not skip missing columns, so read all of them
+        return gpd.read_file(path, ignore_geometry=ignore_geometry, rows=max_features)
 
+
+def _gdalPath(path):
+    """
+    Path GDAL can open for a boundary file: the file itself, or a /vsizip/ path to
+    the .shp or .geojson member of a zip file. None if the zip has no such member.
+    """
     # Check if the path is a zip file
     if path.endswith(".zip"):
-        extracted_folder = os.path.join(temp_path, "temp_extraction_folder")
-        # Create the extraction folder if it doesn't exist
-        os.makedirs(extracted_folder, exist_ok=True)
-        # Extract all files from the zip
-        with zipfile.ZipFile(path, "r") as zip_ref:
-            zip_ref.extractall(extracted_folder)
         # Get the filename without extension
         filename_without_extension = os.path.splitext(os.path.basename(path))[0]
-        # List all extracted files
-        extracted_files = os.listdir(extracted_folder)
+        # List the archive members without extracting them
+        with zipfile.ZipFile(path, "r") as zip_ref:
+            members = zip_ref.namelist()
         # Find the first .geojson or .shp file
         selected_file = next(
             (
                 file
-                for file in extracted_files
-                if filename_without_extension in file and (
-                file.endswith(".shp") or file.endswith(".geojson"))
+                for file in members
+                if not file.startswith("__MACOSX/")
+                and filename_without_extension in file
+                and file.lower().endswith((".shp", ".geojson"))
             ),
             None,
         )
         if selected_file:
-            # Construct the path to the selected file
-            selected_file_path = os.path.join(extracted_folder, selected_file)
-            print(selected_file_path)
-            geom_data = gpd.read_file(selected_file_path)
-            return geom_data
+            # Let GDAL read the member straight out of the archive
+            selected_file_path = f"/vsizip/{os.path.abspath(path)}/{selected_file}"
+            log.debug("Reading %s", selected_file_path)
+            return selected_file_path
+        return None
 
     elif path.endswith(".geojson") or path.endswith(".shp"):
-        # If the path directly points to a .geojson or .shp file, read it using GeoPandas
-        geomData=gpd.read_file(path)
-        return geomData
+        # If the path directly points to a .geojson or .shp file, GDAL can open it as is
+        return path
     else:
         raise ValueError(
             "Error: Please give a valid path with either .geojson, .shp extension, or a zip file containing them."
         )
 
 
-def metaLoad(path, temp_path=None):
+def _loadFile(path, columns=None, ignore_geometry=False, max_features=None):
+    """
+    Read the geometry data behind loadFile, bypassing its cache.
+    """
+    gdal_path = _gdalPath(path)
+    if gdal_path is None:
+        return None
+    return _readFile(
+        gdal_path, columns=columns, ignore_geometry=ignore_geometry, max_features=max_features
+    )
+
+
+def _readCrs(path):
     """
-    Meta Load: Read metadata from a text file or extract from a zip file.
+    CRS of a boundary file, read from the file header with pyogrio so no features
+    are loaded. Without pyogrio, falls back to reading a single feature, which
+    is enough to populate the CRS. Raises ValueError if a zip file holds no
+    .geojson or .shp file.
+    """
+    from pyproj import CRS
+
+    gdal_path = _gdalPath(path)
+    if gdal_path is None:
+        raise ValueError("Error: The zip file does not contain a .geojson or .shp file.")
+    try:
+        import pyogrio
+    except ImportError:
+        return _sharedLoad(path, max_features=1).crs
+    crs = pyogrio.read_info(gdal_path)["crs"]
+    if crs is None:
+        return None
+    return CRS.from_user_input(crs)
+
+
+# Files next to a .shp that hold its attributes, index, projection and encoding
+_shpSidecars = (".dbf", ".shx", ".prj", ".cpg")
+
+
+def _fileStamp(path):
+    """
+    (mtime_ns, size) of path and, for a shapefile, of each sidecar file that
+    exists next to it, so editing any part of the dataset changes the stamp.
+    Raises OSError if path itself is missing.
+    """
+    stat = os.stat(path)
+    stamp = [(stat.st_mtime_ns, stat.st_size)]
+    stem, ext = os.path.splitext(path)
+    if ext.lower() == ".shp":
+        for sidecar in _shpSidecars:
+            for candidate in (stem + sidecar, stem + sidecar.upper()):
+                try:
+                    stat = os.stat(candidate)
+                except OSError:
+                    continue
+                stamp.append((sidecar, stat.st_mtime_ns, stat.st_size))
+                break
+    return tuple(stamp)
+
+
+def _sharedLoad(path, columns=None, ignore_geometry=False, max_features=None):
+    """
+    loadFile without the defensive copy: returns the cached frame itself, for
+    the checks, which only read it.
+    """
+    try:
+        stamp = _fileStamp(path)
+    except OSError:
+        # Let the reader report the problem
+        return _loadFile(
+            path, columns=columns, ignore_geometry=ignore_geometry, max_features=max_features
+        )
+
+    # Key on the file's identity and contents stamp, so an edited file is re-read
+    key = (
+        os.path.abspath(path),
+        stamp,
+        None if columns is None else tuple(columns),
+        ignore_geometry,
+        max_features,
+    )
+    if key in _loadCache:
+        _loadCache.move_to_end(key)
+    else:
+        geomData = _loadFile(
+            path, columns=columns, ignore_geometry=ignore_geometry, max_features=max_features
+        )
+        if geomData is None:
+            return None
+        _loadCache[key] = geomData
+        if len(_loadCache) > loadCacheSize:
+            _loadCache.popitem(last=False)
+    return _loadCache[key]
+
+
+def loadFile(path, temp_path=None, columns=None, ignore_geometry=False, max_features=None):
+    """
+    Load File: Read GeoJSON or Shapefile, either directly or from inside a zip file.
+    The most recently read files are cached, so an unchanged file is not read again
+    until close() is called.
+
+    Parameters:
+    -----------
+    path : str : The file path to the GeoJSON, Shapefile, or a zip file containing them.
+    temp_path : str : Optional. Kept for backwards compatibility; zip files are read
+                    in place through GDAL's /vsizip/ filesystem and nothing is extracted.
+    columns : list of str : Optional. Only read these attribute columns; names that are
+                    not in the file are skipped. All columns are read if pyogrio is not installed.
+    ignore_geometry : bool : Optional. If True, skip reading the geometries.
+    max_features : int : Optional. Only read this many features from the start of the file,
+                    e.g. 1 when only the schema or CRS is needed.
+
+    Returns:
+    --------
+    GeoDataFrame
+        A GeoDataFrame containing the loaded geometry data, or a DataFrame of the
+        attributes if ignore_geometry is True.
+
+    Usage:
+    ------
+    >>> from pygeoboundaries import loadFile
+    >>> geom_data = loadFile(path='/path/to/your/file.geojson')
+    """
+    geomData = _sharedLoad(
+        path, columns=columns, ignore_geometry=ignore_geometry, max_features=max_features
+    )
+    if geomData is None:
+        return None
+    # Hand out a copy so callers cannot modify the cached frame
+    return geomData.copy()
+
+
+def _metaMember(zip_ref):
+    """
+    Name of the first .txt member of an open zip file, or None.
+    """
+    return next(
+        (
+            file
+            for file in zip_ref.namelist()
+            if not file.startswith("__MACOSX/") and file.lower().endswith(".txt")
+        ),
+        None,
+    )
+
+
+def _metaLines(path, member=None):
+    """
+    Yield the lines of a metadata text file, or of the given member of a zip
+    file, decoding them as they are read.
+    """
+    if member is not None:
+        with zipfile.ZipFile(path, "r") as zip_ref:
+            with zip_ref.open(member) as file:
+                yield from io.TextIOWrapper(file, encoding="utf-8")
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            yield from file
+
+
+def metaLoad(path, temp_path=None, lines=False):
+    """
+    Meta Load: Read metadata from a text file, either directly or from inside a zip file.
 
     Parameters:
     -----------
     path : str : The file path to the metadata text file or a zip file containing it.
-    temp_path : str : Optional. The temporary path to extract files from a zip. 
-                    If not provided, it defaults to the directory where the script is located.
+    temp_path : str : Optional. Kept for backwards compatibility; the metadata is read
+                    straight from the zip and nothing is extracted.
+    lines : bool : Optional. If True, return an iterator over the metadata lines that
+                    reads the file as it is consumed, instead of the whole text.
 
     Returns:
     --------
     str
-        A string containing the loaded metadata.
+        A string containing the loaded metadata, or an iterator of lines if lines is True.
+        None if a zip file has no .txt member.
 
     Usage:
     ------
     >>> from pygeoboundaries import metaLoad
-    >>> metadata = metaLoad(path='/path/to/your/file.txt', temp_path='/path/to/temp/folder')
+    >>> metadata = metaLoad(path='/path/to/your/file.txt')
     """
-    if temp_path is None:
-        temp_path = os.path.dirname(os.path.abspath(__file__))
-
     # Check if the path is a zip file
     if path.endswith(".zip"):
-        # Get the filename without extension
-        filename_without_extension = os.path.splitext(os.path.basename(path))[0]
-        extracted_folder = os.path.join(temp_path, "temp_extraction_folder/temp_extraction_folder"+filename_without_extension)
-        # Create the extraction folder if it doesn't exist
-        os.makedirs(extracted_folder, exist_ok=True)
-        # Extract all files from the zip
         with zipfile.ZipFile(path, "r") as zip_ref:
-            zip_ref.extractall(extracted_folder)
-        # List all extracted files
-        extracted_files = os.listdir(extracted_folder)
-        # Find the first .txt file
-        selected_file = next(
-            (
-                file
-                for file in extracted_files
-                if file.endswith(".txt") 
-            ),
-            None,
-        )
-        if selected_file:
-            # Construct the path to the selected file
-            selected_file_path = os.path.join(extracted_folder, selected_file)
-            with open(selected_file_path, "r", encoding="utf-8") as file:
-                metaData = file.read()
-            return metaData
-        
+            # Find the first .txt file; look it up before any streaming starts so
+            # a missing one is reported the same way in both modes
+            selected_file = _metaMember(zip_ref)
+            if selected_file is None:
+                return None
+            if not lines:
+                # Read the member from the archive stream instead of extracting it
+                with zip_ref.open(selected_file) as file:
+                    return file.read().decode("utf-8")
+        return _metaLines(path, selected_file)
+
     elif path.endswith(".txt"):
+        if lines:
+            return _metaLines(path)
         with open(path, "r", encoding="utf-8") as file:
             metaData = file.read()
         return metaData
@@ -153,7 +495,8 @@ def metaLoad(path, temp_path=None):
 
 def close(temp_path=None):
     """
-    Close: Delete the extracted folder.
+    Close: Clear the cache of loaded files and delete the extracted folder, if there is one.
+    Files are no longer extracted, so the folder only exists if an earlier version created it.
 
     Parameters:
     -----------
@@ -166,11 +509,16 @@ def close(temp_path=None):
     >>> close(temp_path='/path/to/temp/folder')  # Specify a custom temporary path
     >>> close()  # Use the default temporary path
     """
+    _loadCache.clear()
+
     if temp_path is None:
         # If no temporary path is provided, use the default path where the script is located
         script_directory = os.path.dirname(os.path.abspath(__file__))
         temp_path = os.path.join(script_directory, "temp_extraction_folder")
 
+    if not os.path.exists(temp_path):
+        return
+
     try:
         shutil.rmtree(temp_path)
         print(f"Directory '{temp_path}' removed successfully.")
@@ -179,179 +527,373 @@ def close(temp_path=None):
 
 
 
-def nameCheck(path, temp_path=None):
+def _countValues(column):
+    """
+    Number of populated entries in a column: not missing and, for text, not blank.
+    """
+    import pandas as pd
+
+    if pd.api.types.is_string_dtype(column.dtype):
+        return int(column.fillna("").astype(str).str.strip().ne("").sum())
+    return int(column.notna().sum())
+
+
+def _nameReport(geomData):
+    """
+    Messages for nameCheck, as a list of (level, message) pairs.
+    """
+    messages = []
+    # Probe the handful of candidates against the column index's hash table
+    nameCol = [col for col in nameColumns if col in geomData.columns]
+    if len(nameCol) == 1:
+        messages.append(("INFO", f"Column for name detected: {nameCol[0]}"))
+        nameColumn = geomData[nameCol[0]]
+        try:
+            nameExample = nameColumn[0]
+            nameValues = _countValues(nameColumn)
+            messages.append(
+                ("INFO", f"Names: {nameValues} | Example: {nameExample}")
+            )
+        except Exception as e:
+            messages.append(
+                ("WARN", "No name values were found, even though a column was present.")
+            )
+    else:
+        messages.append(("WARN", "No column for boundary Names found. "))
+    return messages
+
+
+def nameCheck(path, temp_path=None, geomData=None):
     """
     Name Check: Check for the presence of a column containing names in the provided GeoDataFrame.
 
     Parameters:
     -----------
     path : str : The file path to the GeoJSON, Shapefile, or zipfile.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
+    geomData : GeoDataFrame, optional : Already loaded geometry data. If provided, the file at path is not read again.
 
     Usage:
     ------
     >>> from pygeoboundaries import nameCheck
-    >>> nameCheck(path='/path/to/your/file.geojson', temp_path='/path/to/your/extract/folder')
+    >>> nameCheck(path='/path/to/your/file.geojson')
     """
 
-    geomData = loadFile(path, temp_path=temp_path)
-    nameC = set(
-        ["Name", "name", "NAME", "shapeName", "shapename", "SHAPENAME", "MAX_Name"]
-    )
-    nameCol = list(nameC & set(geomData.columns))
-    if len(nameCol) == 1:
-        print("INFO", "Column for name detected: " + str(nameCol[0]))
+    if geomData is None:
+        # Only the candidate columns are needed, not the geometries
+        geomData = _sharedLoad(path, columns=sorted(nameColumns), ignore_geometry=True)
+    _emit(_nameReport(geomData))
+
+
+def _isoReport(geomData):
+    """
+    Messages for isoCheck, as a list of (level, message) pairs.
+    """
+    messages = []
+    # Probe the handful of candidates against the column index's hash table
+    isoCol = [col for col in isoColumns if col in geomData.columns]
+    if len(isoCol) == 1:
+        messages.append(("INFO", f"Column for ISO detected: {isoCol[0]}"))
+        isoColumn = geomData[isoCol[0]]
         try:
-            nameExample = geomData[str(nameCol[0])][0]
-            nameValues = (
-                geomData[geomData[str(nameCol[0])].str.contains(".*", regex=True)][
-                    str(nameCol[0])
-                ]
-            ).count()
-            print(
-                "INFO", "Names: " + str(nameValues) + " | Example: " + str(nameExample)
+            isoExample = isoColumn[0]
+            isoValues = _countValues(isoColumn)
+            messages.append(
+                ("INFO", f"ISOs: {isoValues} | Example: {isoExample}")
             )
         except Exception as e:
-            print(
-                "WARN", "No name values were found, even though a column was present."
+            messages.append(
+                ("WARN", "No ISOs values were found, even though a column was present.")
             )
     else:
-        print("WARN","No column for boundary Names found. ")
+        messages.append(("WARN", "No column for boundary ISOs found. "))
+    return messages
 
 
-def isoCheck(path, temp_path=None):
+def isoCheck(path, temp_path=None, geomData=None):
     """
     ISO Check: Check for the presence of a column containing ISO codes in the provided GeoDataFrame.
 
     Parameters:
     -----------
     path : str : The file path to the GeoJSON or Shapefile or zipfile.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
+    geomData : GeoDataFrame, optional : Already loaded geometry data. If provided, the file at path is not read again.
 
     Usage:
     ------
     >>> from pygeoboundaries import isoCheck
-    >>> isoCheck(path='/path/to/your/file.geojson', temp_path='/path/to/your/extract/folder')
-    """
-    geomData = loadFile(path, temp_path=temp_path)
-    isoC = set(
-        [
-            "ISO",
-            "ISO_code",
-            "ISO_Code",
-            "iso",
-            "shapeISO",
-            "shapeiso",
-            "shape_iso",
-            "MAX_ISO_Co",
-        ]
+    >>> isoCheck(path='/path/to/your/file.geojson')
+    """
+    if geomData is None:
+        # Only the candidate columns are needed, not the geometries
+        geomData = _sharedLoad(path, columns=sorted(isoColumns), ignore_geometry=True)
+    _emit(_isoReport(geomData))
+
+
+def _boundaryReport(geomData):
+    """
+    Messages for boundaryCheck, as a list of (level, message) pairs.
+    """
+    import numpy as np
+    import shapely
+
+    # Work on the plain object array of shapely geometries, so the masking
+    # below is NumPy indexing rather than GeometryArray wrappers
+    geoms = np.asarray(geomData.geometry.values)
+    # Bounds and validity come straight from shapely's array functions, which
+    # loop over the GEOS geometries in C; bounds is an (N, 4) float array
+    bounds = shapely.bounds(geoms)
+    tol = 1e-5
+    inBounds = (
+        (bounds[:, 0] >= -180 - tol)
+        & (bounds[:, 2] <= 180 + tol)
+        & (bounds[:, 1] >= -90 - tol)
+        & (bounds[:, 3] <= 90 + tol)
     )
-    isoCol = list(isoC & set(geomData.columns))
-    if len(isoCol) == 1:
-        print("INFO", "Column for ISO detected: " + str(isoCol[0]))
-        try:
-            isoExample = geomData[str(isoCol[0])][0]
-            isoValues = (
-                geomData[geomData[str(isoCol[0])].str.contains(".*", regex=True)][
-                    str(isoCol[0])
-                ]
-            ).count()
-            print(
-                "INFO", "ISOs: " + str(isoValues) + " | Example: " + str(isoExample)
+    isValid = shapely.is_valid(geoms)
+    # Only the geometries that failed validation go through the repair attempt
+    fixable = np.ones(len(geoms), dtype=bool)
+    fixable[~isValid] = shapely.is_valid(shapely.make_valid(geoms[~isValid]))
+
+    # Geometries that make_valid repairs are only counted; Python visits just
+    # the ones that still need a diagnostic, and their validity reasons are
+    # worked out in a single array call
+    flagged = np.flatnonzero(~inBounds | ~fixable)
+    reasons = shapely.is_valid_reason(geoms[flagged])
+    messages = []
+    for i, reason in zip(flagged, reasons):
+        if not inBounds[i]:
+            messages.append(
+                (
+                    "CRITICAL",
+                    f"ERROR: This geometry seems to extend past the boundaries of the earth: {reason}",
+                )
             )
-        except Exception as e:
-            print(
-                "WARN", "No ISOs values were found, even though a column was present."
+        if not fixable[i]:
+            messages.append(
+                (
+                    "CRITICAL",
+                    f"ERROR: Something is wrong with this geometry, and we can't fix it: {reason}",
+                )
             )
-    else:
-        print("WARN","No column for boundary ISOs found. ")
+
+    repaired = int(np.count_nonzero(~isValid & fixable))
+    if repaired:
+        messages.append(
+            ("WARN", f"Invalid geometries corrected with make_valid in shapely: {repaired}")
+        )
+    return messages
 
 
-def boundaryCheck(path, temp_path=None):
+def boundaryCheck(path, temp_path=None, geomData=None):
     """
     Boundary Check: Check for valid geometries and whether they extend past the boundaries of the Earth.
 
     Parameters:
     -----------
     path : str : The file path to the GeoJSON or Shapefile or zipfile.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
+    geomData : GeoDataFrame, optional : Already loaded geometry data. If provided, the file at path is not read again.
 
     Usage:
     ------
     >>> from pygeoboundaries import boundaryCheck
-    >>> boundaryCheck(path='/path/to/your/file.geojson', temp_path='/path/to/your/extract/folder')
-    """
-    geomData = loadFile(path, temp_path=temp_path)
-    for index, row in geomData.iterrows():
-        xmin = row["geometry"].bounds[0]
-        ymin = row["geometry"].bounds[1]
-        xmax = row["geometry"].bounds[2]
-        ymax = row["geometry"].bounds[3]
-        tol = 1e-5
-        valid = (
-            (xmin >= -180 - tol)
-            and (xmax <= 180 + tol)
-            and (ymin >= -90 - tol)
-            and (ymax <= 90 + tol)
-        )
-        if not valid:
-            print(
-                "CRITICAL",
-                "ERROR: This geometry seems to extend past the boundaries of the earth: "
-                + str(explain_validity(row["geometry"])),
-            )
+    >>> boundaryCheck(path='/path/to/your/file.geojson')
+    """
+    if geomData is None:
+        geomData = _sharedLoad(path)
+    # The report is emitted as one batch, a single write when printing to stdout
+    _emit(_boundaryReport(geomData))
 
-        if not row["geometry"].is_valid:
-            print(
-                "WARN",
-                "Something is wrong with this geometry, but we might be able to fix it with a buffer: "
-                + str(explain_validity(row["geometry"])),
-            )
-            if not row["geometry"].buffer(0).is_valid:
-                print(
-                    "CRITICAL",
-                    "ERROR: Something is wrong with this geometry, and we can't fix it: "
-                    + str(explain_validity(row["geometry"])),
-                )
-            else:
-                print(
-                    "WARN", "A geometry error was corrected with buffer=0 in shapely."
-                )
+
+def _projectionReport(crs):
+    """
+    Messages for projectionCheck, as a list of (level, message) pairs.
+    """
+    # pyproj compares the parsed CRS, so any spelling of EPSG:4326 matches
+    if crs == "EPSG:4326":
+        return [("INFO", f"Projection confirmed as {crs}")]
+    return [
+        (
+            "CRITICAL",
+            f"The projection must be EPSG 4326.  The file proposed has a projection of: {crs}",
+        )
+    ]
 
 
-def projectionCheck(path, temp_path=None):
+def projectionCheck(path, temp_path=None, geomData=None):
     """
     Projection Check: Check if the geometry data has the required EPSG 4326 projection.
 
     Parameters:
     -----------
     path : str : The file path to the GeoJSON or Shapefile or zipfile.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
+    geomData : GeoDataFrame, optional : Already loaded geometry data. If provided, the file at path is not read again.
 
     Usage:
     ------
     >>> from pygeoboundaries import projectionCheck
-    >>> projectionCheck(path='/path/to/your/file.geojson', temp_path='/path/to/your/extract/folder')
+    >>> projectionCheck(path='/path/to/your/file.geojson')
     """
-    geomData = loadFile(path, temp_path=temp_path)
-    if geomData.crs == "epsg:4326":
-        print("INFO", "Projection confirmed as " + str(geomData.crs))
+    if geomData is None:
+        # Only the header is needed, not the features
+        crs = _readCrs(path)
     else:
-        print(
+        crs = geomData.crs
+    _emit(_projectionReport(crs))
+
+
+def _checkYear(val):
+    # pre 4.0 legacy cleanup
+    if ".0" in val:
+        val = val[:-2]
+    try:
+        if "to" in val:
+            date1, date2 = val.split(" to ")
+            date1 = datetime.datetime.strptime(date1, "%d-%m-%Y")
+            date2 = datetime.datetime.strptime(date2, "%d-%m-%Y")
+            return ("INFO", f"Valid date range {val} detected.")
+        year = int(float(val))
+        if (year > 1950) and (year <= datetime.datetime.now().year):
+            return ("INFO", f"Valid year {year} detected.")
+        return (
+            "CRITICAL",
+            f"The year in the meta.txt file is invalid (expected value is between 1950 and present): {year}",
+        )
+    except Exception as e:
+        return (
+            "CRITICAL",
+            f"The year provided in the metadata {val} was invalid. This is what I know:{e}",
+        )
+
+
+def _checkBoundaryType(val):
+    try:
+        if val.upper().translate(_whitespace) in _admTypeSet:
+            return ("INFO", f"Valid Boundary Type detected: {val}.")
+        return (
+            "CRITICAL",
+            f"The boundary type in the meta.txt file is invalid: {val}",
+        )
+    except Exception as e:
+        return (
             "CRITICAL",
-            "The projection must be EPSG 4326.  The file proposed has a projection of: "
-            + str(geomData.crs),
+            f"The boundary type in the meta.txt file was invalid. This is what I know:{e}",
         )
 
 
-def metaCheck(path, temp_path=None):
+def _checkIso(val):
+    if len(val) != 3:
+        return (
+            "CRITICAL",
+            "ISO is invalid - we expect a 3-character ISO code following ISO-3166-1 (Alpha 3).",
+        )
+    if val not in _getIsoList():
+        return (
+            "CRITICAL",
+            "ISO is not on our list of valid ISO-3 codes.  See https://github.com/wmgeolab/geoBoundaryBot/blob/main/dta/iso_3166_1_alpha_3.csv for all valid codes this script checks against.",
+        )
+    return ("INFO", f"Valid ISO detected: {val}")
+
+
+def _checkCanonical(val):
+    if len(val.translate(_whitespace)) > 0:
+        if val.lower() not in _nullValues:
+            return ("INFO", f"Canonical name detected: {val}")
+    else:
+        return ("WARN", "No canonical name detected.")
+
+
+def _checkSource(val):
+    if len(val.translate(_whitespace)) > 0:
+        if val.lower() not in _nullValues:
+            return ("INFO", f"Source detected: {val}")
+
+
+def _checkReleaseType(val):
+    if val.lower() not in _releaseTypes:
+        return ("CRITICAL", f"Invalid release type detected: {val}")
+    return ("INFO", f"Valid Release Type detected: {val}")
+
+
+def _checkLicense(val):
+    # Clean up shorthand license names to long form (i.e., CC-BY --> CC Attribution)
+    # Only implementing for very common mass-import issues (i.e., Intergovernmental from HDX)
+    if val == "Creative Commons Attribution for Intergovernmental Organisations":
+        val = "Creative Commons Attribution 3.0 Intergovernmental Organisations (CC BY 3.0 IGO)"
+    if val.lower() not in _getLicenseList():
+        return ("CRITICAL", f"Invalid license detected: {val}")
+    return ("INFO", f"Valid license type detected: {val}")
+
+
+def _checkLicenseNotes(val):
+    if len(val.translate(_whitespace)) > 0:
+        if val.lower() not in _nullValues:
+            return ("INFO", f"License notes detected: {val}")
+    else:
+        return ("INFO", "No license notes detected.")
+
+
+def _checkLicenseSource(val):
+    if len(val.translate(_whitespace)) > 0 and val.lower() not in _nullValues:
+        return ("INFO", f"License source detected: {val}")
+    return ("CRITICAL", "No license source detected.")
+
+
+def _checkSourceLink(val):
+    if len(val.translate(_whitespace)) > 0 and val.lower() not in _nullValues:
+        return ("INFO", f"Data Source Found: {val}")
+    return ("CRITICAL", "ERROR: No link to source data found.")
+
+
+def _checkOtherNotes(val):
+    if len(val.translate(_whitespace)) > 0:
+        if val.lower() not in _nullValues:
+            return ("INFO", f"Other notes detected: {val}")
+    else:
+        return ("WARN", "No other notes detected.  This field is optional.")
+
+
+# Dispatch table for metaCheck: each entry pairs a test on the lower-cased
+# meta.txt key with the validator for that line's value, in reporting order.
+_metaValidators = (
+    (lambda key: "year" in key, _checkYear),
+    (lambda key: "boundary type" in key and "name" not in key, _checkBoundaryType),
+    (lambda key: "iso" in key, _checkIso),
+    (lambda key: "canonical" in key, _checkCanonical),
+    (
+        lambda key: "source" in key and "license" not in key and "data" not in key,
+        _checkSource,
+    ),
+    (lambda key: "release type" in key, _checkReleaseType),
+    (lambda key: key == "license", _checkLicense),
+    (lambda key: "license notes" in key, _checkLicenseNotes),
+    (lambda key: "license source" in key, _checkLicenseSource),
+    (lambda key: "link to source data" in key, _checkSourceLink),
+    (lambda key: "other notes" in key, _checkOtherNotes),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _validatorsFor(key):
+    """
+    Validators that apply to a lower-cased meta.txt key. Keys repeat across
+    files, so the table is only scanned once per distinct key.
+    """
+    return tuple(validator for matches, validator in _metaValidators if matches(key))
+
+
+def metaCheck(path, temp_path=None, metaData=None):
     """
     Meta Check: Validate metadata information from a text file.
 
     Parameters:
     -----------
     path : str : The file path to the metadata text file or zipfile that contains meta file.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
+    metaData : str or iterable of str, optional : Already loaded metadata text, or its lines. If provided, the file at path is not read again.
 
     Returns:
     --------
@@ -360,167 +902,51 @@ def metaCheck(path, temp_path=None):
     Usage:
     ------
     >>> from pygeoboundaries import metaCheck
-    >>> metaCheck(path='/path/to/your/meta.txt', temp_path='/path/to/your/extract/folder')
+    >>> metaCheck(path='/path/to/your/meta.txt')
     """
-    metaData = metaLoad(path, temp_path=temp_path)
-    print("INFO", "Beginning meta.txt validity checks.")
+    if metaData is None:
+        # Stream the lines so reading is fused with validation
+        metaData = metaLoad(path, temp_path=temp_path, lines=True)
+    # The report is emitted as one batch, a single write when printing to stdout
+    _emit(_metaReport(metaData))
 
-    for m in metaData.splitlines():
-        try:
-            e = m.split(":")
-            if len(e) > 2:
-                e[1] = e[1] + e[2]
-            key = e[0].strip()
-            val = e[1].strip()
-        except Exception as e:
-            print(
-                "WARN",
-                "At least one line of meta.txt failed to be read correctly: "
-                + str(m)
-                + " | "
-                + str(e),
-            )
-            key = "readError"
-            val = "readError"
 
-        if ("Year" in key) or ("year" in key):
-            # pre 4.0 legacy cleanup
-            if ".0" in str(val):
-                val = str(val)[:-2]
-            try:
-                if "to" in val:
-                    date1, date2 = val.split(" to ")
-                    date1 = datetime.datetime.strptime(date1, "%d-%m-%Y")
-                    date2 = datetime.datetime.strptime(date2, "%d-%m-%Y")
-                    print("INFO", "Valid date range " + str(val) + " detected.")
-                else:
-                    year = int(float(val))
-                    if (year > 1950) and (year <= datetime.datetime.now().year):
-                        print("INFO", "Valid year " + str(year) + " detected.")
-                    else:
-                        print(
-                            "CRITICAL",
-                            "The year in the meta.txt file is invalid (expected value is between 1950 and present): "
-                            + str(year),
-                        )
-            except Exception as e:
-                print(
-                    "CRITICAL",
-                    "The year provided in the metadata "
-                    + str(val)
-                    + " was invalid. This is what I know:"
-                    + str(e),
-                )
+# "key: value" on the first colon, with whitespace around both parts trimmed
+_metaLine = re.compile(r"^\s*([^:]*?)\s*:\s*(.*?)\s*$")
 
-        if "boundary type" in key.lower() and "name" not in key.lower():
-            try:
-                validTypes = ["ADM0", "ADM1", "ADM2", "ADM3", "ADM4", "ADM5"]
-                if val.upper().replace(" ", "") in validTypes:
-                    print("INFO", "Valid Boundary Type detected: " + str(val) + ".")
-                else:
-                    print(
-                        "CRITICAL",
-                        "The boundary type in the meta.txt file is invalid: "
-                        + str(val),
-                    )
-            except Exception as e:
-                print(
-                    "CRITICAL",
-                    "The boundary type in the meta.txt file was invalid. This is what I know:"
-                    + str(e),
-                )
 
-        if "iso" in key.lower().strip():
-            if len(val) != 3:
-                print(
-                    "CRITICAL",
-                    "ISO is invalid - we expect a 3-character ISO code following ISO-3166-1 (Alpha 3).",
-                )
-            elif val not in isoList1:
-                print(
-                    "CRITICAL",
-                    "ISO is not on our list of valid ISO-3 codes.  See https://github.com/wmgeolab/geoBoundaryBot/blob/main/dta/iso_3166_1_alpha_3.csv for all valid codes this script checks against.",
+def _metaReport(metaData):
+    """
+    Messages for metaCheck, as a list of (level, message) pairs. metaData is
+    the metadata text, an iterable of its lines, or None if there is no meta.txt.
+    """
+    messages = [("INFO", "Beginning meta.txt validity checks.")]
+    if metaData is None:
+        messages.append(("CRITICAL", "No meta.txt file was found."))
+        return messages
+    if isinstance(metaData, str):
+        metaData = metaData.splitlines()
+
+    for m in metaData:
+        m = m.rstrip("\r\n")
+        match = _metaLine.match(m)
+        if match is None:
+            messages.append(
+                (
+                    "WARN",
+                    f"At least one line of meta.txt failed to be read correctly: {m}",
                 )
-            else:
-                print("INFO", "Valid ISO detected: " + str(val))
-
-        if "canonical" in key.lower():
-            if len(val.replace(" ", "")) > 0:
-                if val.lower() not in ["na", "nan", "null"]:
-                    print("INFO", "Canonical name detected: " + str(val))
-            else:
-                print("WARN", "No canonical name detected.")
-
-        if (
-            "source" in key.lower()
-            and "license" not in key.lower()
-            and "data" not in key.lower()
-        ):
-            if len(val.replace(" ", "")) > 0:
-                if val.lower() not in ["na", "nan", "null"]:
-                    print("INFO", "Source detected: " + str(val))
-
-        if "release type" in key.lower():
-            if val.lower() not in [
-                "geoboundaries",
-                "gbauthoritative",
-                "gbhumanitarian",
-                "gbopen",
-                "un_salb",
-                "un_ocha",
-            ]:
-                print("CRITICAL", "Invalid release type detected: " + str(val))
-
-            else:
-                print("INFO", "Valid Release Type detected: " + str(val))
-
-        if "license" == key.lower():
-            # Clean up shorthand license names to long form (i.e., CC-BY --> CC Attribution)
-            # Only implementing for very common mass-import issues (i.e., Intergovernmental from HDX)
-            if (
-                val
-                == "Creative Commons Attribution for Intergovernmental Organisations"
-            ):
-                val = "Creative Commons Attribution 3.0 Intergovernmental Organisations (CC BY 3.0 IGO)"
-            if val.lower().strip() not in licenseList1:
-                print("CRITICAL", "Invalid license detected: " + str(val))
-            else:
-                print("INFO", "Valid license type detected: " + str(val))
-
-        if "license notes" in key.lower():
-            if len(val.replace(" ", "")) > 0:
-                if val.lower() not in ["na", "nan", "null"]:
-                    print("INFO", "License notes detected: " + str(val))
-            else:
-                print("INFO", "No license notes detected.")
-
-        if("license source" in key.lower()):
-            if(len(val.replace(" ","")) > 0):
-                if(val.lower() not in ["na", "nan", "null"]):
-                    print("INFO", "License source detected: " + str(val))
-                else:
-                    print("CRITICAL", "No license source detected.")
-            else:
-                print("CRITICAL", "No license source detected.")
-
-        if "link to source data" in key.lower():
-            if len(val.replace(" ", "")) > 0:
-                if val.lower() not in ["na", "nan", "null"]:
-                    print("INFO", "Data Source Found: " + str(val))
-
-                else:
-                    print("CRITICAL", "ERROR: No link to source data found.")
-
-            else:
-                print("CRITICAL", "ERROR: No link to source data found.")
-
-        if "other notes" in key.lower():
-            if len(val.replace(" ", "")) > 0:
-                if val.lower() not in ["na", "nan", "null"]:
-                    print("INFO", "Other notes detected: " + val)
-            else:
-                print("WARN", "No other notes detected.  This field is optional.")
+            )
+            continue
 
+        # The pattern already trims both sides; lower the key once for every validator
+        key = match.group(1).lower()
+        val = match.group(2)
+        for validator in _validatorsFor(key):
+            result = validator(val)
+            if result is not None:
+                messages.append(result)
+    return messages
 
 
 def checkLicensePng(path):
@@ -533,7 +959,8 @@ def checkLicensePng(path):
 
     Returns:
     --------
-    None
+    bool
+        True if a license image was found, False otherwise.
 
     Usage:
     ------
@@ -541,21 +968,26 @@ def checkLicensePng(path):
     >>> has_license_image = checkLicensePng('/path/to/your/file.zip')
     """
 
-    license_extensions = ['.png', '.jpg']
+    license_extensions = (".png", ".jpg")
 
     # Check if the path is a zip file
     if path.endswith(".zip"):
         with zipfile.ZipFile(path, "r") as zip_ref:
-            # Get a list of file names in the zip file
-            file_names = zip_ref.namelist()
-
-            # Check if there is any file with .png or .jpg extension
-            for ext in license_extensions:
-                if any(file.lower().endswith(ext) for file in file_names):
-                    print("INFO", f"License image found with extension {ext}.")
-                    return True
-                else:
-                    print("WARN", "No license image found. Checked for license.png and license.jpg.")
+            # Find the first file with a .png or .jpg extension in a single pass
+            license_file = next(
+                (
+                    file
+                    for file in zip_ref.namelist()
+                    if file.lower().endswith(license_extensions)
+                ),
+                None,
+            )
+        if license_file:
+            ext = os.path.splitext(license_file)[1].lower()
+            _emit([("INFO", f"License image found with extension {ext}.")])
+            return True
+        _emit([("WARN", "No license image found. Checked for license.png and license.jpg.")])
+        return False
     else:
         raise ValueError("Error: Please give a valid path with .zip extension.")
     
@@ -567,7 +999,7 @@ def allChecks(path, temp_path=None):
     Parameters:
     -----------
     path : str : The file path to the data file.
-    temp_path : str, optional : The path where the zip content will be extracted. If not provided, defaults to None.
+    temp_path : str, optional : Kept for backwards compatibility; zip files are read in place and nothing is extracted.
 
     Returns:
     --------
@@ -576,14 +1008,26 @@ def allChecks(path, temp_path=None):
     Usage:
     ------
     >>> from pygeoboundaries import allChecks
-    >>> allChecks(path='/path/to/your/datafile', temp_path='/path/to/your/extract/folder')
+    >>> allChecks(path='/path/to/your/datafile')
     """
     if path.endswith(".zip"):
-        nameCheck(path, temp_path=temp_path)
-        isoCheck(path, temp_path=temp_path)
-        boundaryCheck(path, temp_path=temp_path)
-        projectionCheck(path, temp_path=temp_path)
-        metaCheck(path, temp_path=temp_path)
+        # Read the archive once and share the result across all checks; they
+        # only read it, so the cached frame is used without a copy
+        geomData = _sharedLoad(path)
+        metaData = metaLoad(path, temp_path=temp_path)
+        # The checks only read the shared data, so run them side by side; the
+        # shapely and GDAL work in them releases the GIL
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            reports = [
+                executor.submit(_nameReport, geomData),
+                executor.submit(_isoReport, geomData),
+                executor.submit(_boundaryReport, geomData),
+                executor.submit(_projectionReport, geomData.crs),
+                executor.submit(_metaReport, metaData),
+            ]
+            # Write each report in the usual order as soon as it is ready
+            for report in reports:
+                _emit(report.result())
         checkLicensePng(path)
         print("Performed all the checks.")
     else:
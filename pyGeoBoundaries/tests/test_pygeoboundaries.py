@@ -1,5 +1,24 @@
+import logging
+import os
+import shutil
+import time
+import zipfile
+
+import geopandas as gpd
+import pytest
+import requests
+from shapely.geometry import Polygon, box
+
+import pygeoboundaries.pygeoboundaries as gb
 from pygeoboundaries import __version__
-from pygeoboundaries import nameCheck
+from pygeoboundaries import (
+    allChecks,
+    nameCheck,
+    boundaryCheck,
+    projectionCheck,
+    metaCheck,
+    checkLicensePng,
+)
 
 
 def test_version():
@@ -9,3 +28,270 @@ def test_version():
 def test_nameCheck():
     results = nameCheck("/home/rohith/work/trial/AIA_ADM0.zip","/home/rohith/work/trial/")
     assert results == None
+
+
+def test_metaCheck_splits_on_first_colon(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = tmp_path / "meta.txt"
+    path.write_text("Link to Source Data: https://example.org/data\nno colon here\n")
+    metaCheck(str(path))
+    text = caplog.text
+    assert "Data Source Found: https://example.org/data" in text
+    assert "At least one line of meta.txt failed to be read correctly: no colon here" in text
+
+
+@pytest.fixture
+def referenceLists(tmp_path, monkeypatch):
+    # Fresh copies of the reference CSVs in the cache, so nothing is downloaded
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "iso_3166_1_alpha_3.csv").write_text("Alpha-3code\nAIA\n")
+    (cache / "gbLicenses.csv").write_text(
+        "license_name\n Creative Commons Attribution 4.0 International (CC BY 4.0) \n"
+    )
+    monkeypatch.setattr(gb, "_cacheDir", lambda: str(cache))
+    gb._getReferenceLists.cache_clear()
+    yield
+    gb._getReferenceLists.cache_clear()
+
+
+class _Response:
+    text = "Alpha-3code\nAIA\n"
+
+    def raise_for_status(self):
+        pass
+
+
+class _Session:
+    def __init__(self, error=None):
+        self.error = error
+
+    def get(self, url, timeout=None):
+        if self.error is not None:
+            raise self.error
+        return _Response()
+
+
+def _staleCache(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    stale = cache / "iso_3166_1_alpha_3.csv"
+    stale.write_text("Alpha-3code\nOLD\n")
+    old = time.time() - gb.cacheMaxAge - 60
+    os.utime(stale, (old, old))
+    monkeypatch.setattr(gb, "_cacheDir", lambda: str(cache))
+    return stale
+
+
+def test_fetchCsv_stale_cache_when_download_fails(tmp_path, monkeypatch):
+    stale = _staleCache(tmp_path, monkeypatch)
+    monkeypatch.setattr(gb, "_getSession", lambda: _Session(requests.ConnectionError()))
+    assert gb._fetchCsv("https://example.org", stale.name) == "Alpha-3code\nOLD\n"
+
+
+def test_fetchCsv_no_cache_and_download_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(gb, "_cacheDir", lambda: str(tmp_path / "cache"))
+    monkeypatch.setattr(gb, "_getSession", lambda: _Session(requests.ConnectionError()))
+    with pytest.raises(requests.ConnectionError):
+        gb._fetchCsv("https://example.org", "iso_3166_1_alpha_3.csv")
+
+
+def test_fetchCsv_refreshes_stale_cache(tmp_path, monkeypatch):
+    stale = _staleCache(tmp_path, monkeypatch)
+    monkeypatch.setattr(gb, "_getSession", lambda: _Session())
+    assert gb._fetchCsv("https://example.org", stale.name) == "Alpha-3code\nAIA\n"
+    # The download replaced the cached copy and left no partial file behind
+    assert stale.read_text() == "Alpha-3code\nAIA\n"
+    assert time.time() - os.path.getmtime(stale) < gb.cacheMaxAge
+    assert os.listdir(stale.parent) == [stale.name]
+
+
+def test_metaCheck_license_case(tmp_path, caplog, referenceLists):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = tmp_path / "meta.txt"
+    path.write_text(
+        "ISO-3166-1 (Alpha-3): AIA\n"
+        "License: CREATIVE COMMONS ATTRIBUTION 4.0 INTERNATIONAL (CC BY 4.0)\n"
+    )
+    metaCheck(str(path))
+    text = caplog.text
+    assert "Valid ISO detected: AIA" in text
+    assert "Valid license type detected: CREATIVE COMMONS" in text
+
+
+def test_checkLicensePng(tmp_path):
+    path = str(tmp_path / "AIA_ADM0.zip")
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("AIA_ADM0.geojson", "{}")
+        zip_ref.writestr("license.JPG", b"")
+    assert checkLicensePng(path) is True
+
+
+def test_checkLicensePng_missing(tmp_path, caplog):
+    path = str(tmp_path / "AIA_ADM0.zip")
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("AIA_ADM0.geojson", "{}")
+    assert checkLicensePng(path) is False
+    assert caplog.text.count("No license image found") == 1
+
+
+def test_boundaryCheck_make_valid(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = str(tmp_path / "AIA_ADM0.geojson")
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+    offEarth = box(179, 0, 181, 1)
+    gpd.GeoDataFrame(geometry=[bowtie, offEarth], crs="EPSG:4326").to_file(path)
+    boundaryCheck(path)
+    # Only the geometry make_valid cannot help is reported on its own; the
+    # repaired one is counted
+    assert caplog.messages == [
+        "ERROR: This geometry seems to extend past the boundaries of the earth: Valid Geometry",
+        "Invalid geometries corrected with make_valid in shapely: 1",
+    ]
+
+
+def test_projectionCheck_reads_header(tmp_path, caplog, monkeypatch):
+    path = str(tmp_path / "AIA_ADM0.shp")
+    gpd.GeoDataFrame(geometry=[Polygon([(0, 0), (1, 0), (1, 1)])], crs="EPSG:3857").to_file(path)
+
+    def _noLoad(*args, **kwargs):
+        raise AssertionError("features should not be read")
+
+    monkeypatch.setattr(gb, "_loadFile", _noLoad)
+    projectionCheck(path)
+    assert caplog.records[-1].levelno == logging.CRITICAL
+    assert "The projection must be EPSG 4326." in caplog.text
+
+
+def test_projectionCheck_zip_without_boundary_file(tmp_path):
+    path = str(tmp_path / "AIA_ADM0.zip")
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("meta.txt", "Boundary Type: ADM0\n")
+    with pytest.raises(ValueError, match="does not contain a .geojson or .shp file"):
+        projectionCheck(path)
+
+
+def test_nameCheck_counts_blank_names(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = str(tmp_path / "AIA_ADM0.geojson")
+    gpd.GeoDataFrame(
+        {"shapeName": ["Anguilla", "", "  ", None]},
+        geometry=[box(i, 0, i + 1, 1) for i in range(4)],
+        crs="EPSG:4326",
+    ).to_file(path)
+    nameCheck(path)
+    assert "Names: 1 | Example: Anguilla" in caplog.text
+
+
+def test_metaCheck_missing_meta(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = str(tmp_path / "AIA_ADM0.zip")
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("AIA_ADM0.geojson", "{}")
+    metaCheck(path)
+    assert [r.levelno for r in caplog.records] == [logging.INFO, logging.CRITICAL]
+    assert "No meta.txt file was found." in caplog.text
+
+
+def _writeShp(directory, column):
+    directory.mkdir()
+    path = str(directory / "AIA_ADM0.shp")
+    gpd.GeoDataFrame(
+        {column: ["Anguilla"]}, geometry=[box(-63.2, 18.1, -62.9, 18.3)], crs="EPSG:4326"
+    ).to_file(path)
+    return path
+
+
+def test_nameCheck_shp_sidecar_edit(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    path = _writeShp(tmp_path / "shp", "shapeName")
+    nameCheck(path)
+    assert "Column for name detected: shapeName" in caplog.text
+    caplog.clear()
+
+    # Only the attribute table changes; the .shp itself is untouched
+    renamed = _writeShp(tmp_path / "renamed", "NAME")
+    dbf = path[:-4] + ".dbf"
+    shutil.copyfile(renamed[:-4] + ".dbf", dbf)
+    stat = os.stat(dbf)
+    os.utime(dbf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    nameCheck(path)
+    assert "Column for name detected: NAME" in caplog.text
+
+
+def test_log_level_filters_results(tmp_path, caplog, capsys, monkeypatch):
+    path = tmp_path / "meta.txt"
+    path.write_text("Boundary Representative of Year: 1900\n")
+
+    caplog.set_level(logging.WARNING, logger="pygeoboundaries")
+    metaCheck(str(path))
+    assert "Beginning meta.txt validity checks." not in caplog.text
+    assert "The year in the meta.txt file is invalid" in caplog.text
+
+    # Without any logging configured the results are printed, at the same level
+    monkeypatch.setattr(gb.log, "hasHandlers", lambda: False)
+    metaCheck(str(path))
+    out = capsys.readouterr().out
+    assert out.startswith("CRITICAL The year in the meta.txt file is invalid")
+    assert "INFO" not in out
+
+
+def test_allChecks_zipped_shapefile(tmp_path, caplog, capsys, monkeypatch, referenceLists):
+    caplog.set_level(logging.INFO, logger="pygeoboundaries")
+    shp = tmp_path / "shp"
+    shp.mkdir()
+    gpd.GeoDataFrame(
+        {"shapeName": ["Anguilla"], "shapeISO": ["AI"]},
+        geometry=[box(-63.2, 18.1, -62.9, 18.3)],
+        crs="EPSG:4326",
+    ).to_file(str(shp / "AIA_ADM0.shp"))
+    path = str(tmp_path / "AIA_ADM0.zip")
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        for member in sorted(os.listdir(shp)):
+            zip_ref.write(shp / member, member)
+        zip_ref.writestr(
+            "meta.txt",
+            "Boundary Type: ADM0\n"
+            "ISO-3166-1 (Alpha-3): AIA\n"
+            "License: Creative Commons Attribution 4.0 International (CC BY 4.0)\n",
+        )
+        zip_ref.writestr("license.png", b"")
+
+    # allChecks reads the archive once and shares it across the checks
+    reads = []
+    readFile = gb._readFile
+
+    def _countingRead(*args, **kwargs):
+        reads.append(args[0])
+        return readFile(*args, **kwargs)
+
+    monkeypatch.setattr(gb, "_readFile", _countingRead)
+    allChecks(path)
+    assert reads == [f"/vsizip/{path}/AIA_ADM0.shp"]
+    assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+        ("INFO", "Column for name detected: shapeName"),
+        ("INFO", "Names: 1 | Example: Anguilla"),
+        ("INFO", "Column for ISO detected: shapeISO"),
+        ("INFO", "ISOs: 1 | Example: AI"),
+        ("INFO", "Projection confirmed as EPSG:4326"),
+        ("INFO", "Beginning meta.txt validity checks."),
+        ("INFO", "Valid Boundary Type detected: ADM0."),
+        ("INFO", "Valid ISO detected: AIA"),
+        (
+            "INFO",
+            "Valid license type detected: Creative Commons Attribution 4.0 International (CC BY 4.0)",
+        ),
+        ("INFO", "License image found with extension .png."),
+    ]
+    assert capsys.readouterr().out == "Performed all the checks.\n"
+
+    # The standalone checks find the same members inside the zip
+    caplog.clear()
+    nameCheck(path)
+    projectionCheck(path)
+    assert caplog.messages == [
+        "Column for name detected: shapeName",
+        "Names: 1 | Example: Anguilla",
+        "Projection confirmed as EPSG:4326",
+    ]